@@ -19,11 +19,18 @@ import sys
 
 pygame.init()
 display = None
+fonts = {}
 
 def init(screen):
     global display
     display = screen
 
+def get_font(font, size):
+    # Open each font file once per size instead of on every add_text call
+    if (font, size) not in fonts:
+        fonts[(font, size)] = pygame.font.Font(font, size)
+    return fonts[(font, size)]
+
 class Button:
     def __init__(self, x, y, w, h, action=None, colorNotActive=(189, 195, 199), colorActive=None):
         self.x = x
@@ -39,9 +46,15 @@ class Button:
         self.font = None
         self.text = None
         self.text_pos = None
+        self.text_args = None
 
     def add_text(self, text, size=20, font="Times New Roman", text_color=(0, 0, 0)):
-        self.font = pygame.font.Font(font, size)
+        # Labels are refreshed every frame; only re-render when the text changes
+        if self.text_args == (text, size, font, text_color):
+            return
+        self.text_args = (text, size, font, text_color)
+
+        self.font = get_font(font, size)
         self.text = self.font.render(text, True, text_color)
         self.text_pos = self.text.get_rect()
 
@@ -8,7 +8,7 @@
               Class BIRD
               Class BLOCK
               Class SLINGSHOT
-              func collision_handler, block_collision_handler
+              func load_image, collision_handler, block_collision_handler
 
     Requirements: Pygame, sys, math, random
 
@@ -37,6 +37,14 @@ def init(screen):
     (width, height) = display.get_rect().size
     height -= ground
 
+images = {}
+
+def load_image(path):
+    # Load each image from disk once, converted to the display's pixel format
+    if path not in images:
+        images[path] = pygame.image.load(path).convert_alpha()
+    return images[path]
+
 class Vector:
     def __init__(self, magnitude=0, angle=radians(0)):
         self.magnitude = magnitude
@@ -67,12 +75,12 @@ class Pig:
         else:
             self.velocity = v
 
-        self.pig1_image = pygame.image.load("Images/pig1.png")
-        self.pig2_image = pygame.image.load("Images/pig3.png")
+        self.pig1_image = load_image("Images/pig1.png")
+        self.pig2_image = load_image("Images/pig3.png")
 
-        self.pig_dead = pygame.image.load("Images/pig_damaged.png")
+        self.pig_dead = load_image("Images/pig_damaged.png")
 
-        self.bird_image = pygame.image.load("Images/bird.png")
+        self.bird_image = load_image("Images/bird.png")
 
         if type == "PIG":
             self.image = random.choice([self.pig1_image, self.pig2_image])
@@ -188,8 +196,8 @@ class Block:
         self.x = x
         self.y = y
 
-        self.block_image = pygame.image.load("Images/block1.png")
-        self.block_destroyed_image = pygame.image.load("Images/block_destroyed1.png")
+        self.block_image = load_image("Images/block1.png")
+        self.block_destroyed_image = load_image("Images/block_destroyed1.png")
 
         self.image = self.block_image
 
@@ -215,7 +223,6 @@ class Block:
         return [coord[0] + self.x, coord[1] + self.y]
 
     def draw(self):
-        pygame.transform.rotate(self.image, self.rotateAngle)
         display.blit(self.image, (self.x - self.w/2, self.y))
 
     def destroy(self):
@@ -6,6 +6,9 @@ pen = turtle.Turtle()
 # Set the speed of the turtle to the maximum (0)
 pen.speed(0)
 
+# Turn off animation and draw the whole picture in one screen refresh
+turtle.tracer(0, 0)
+
 def curve():
     # Reduce the number of iterations by increasing the forward step
     for i in range(100):
@@ -33,4 +36,5 @@ def text1():
 heart()
 text1()
 pen.ht()  # Hide the turtle
+turtle.update()  # Show the finished drawing
 turtle.done()
@@ -25,7 +25,8 @@ road1 = Entity(
 road2 = duplicate(road1, y=15)
 pair = [road1, road2]
 
-enemies = []
+enemies_left = []   ##Enemies spawned left of the middle move faster
+enemies_right = []
 import random
 def newEnemy():
     val = random.uniform(-2,2)
@@ -37,21 +38,26 @@ def newEnemy():
         color=color.random_color(), ##We select the specific color of your enemy
         
     )
-    enemies.append(new)
+    if new.x < 0:
+        enemies_left.append(new)
+    else:
+        enemies_right.append(new)
     invoke(newEnemy, delay=0.5)
 newEnemy()
 
 def update():
-    car.x -= held_keys['a'] * 5 * time.dt
-    car.x += held_keys['d'] * 5 * time.dt
+    dt = time.dt
+    car.x += (held_keys['d'] - held_keys['a']) * 5 * dt
+    road_step = 6 * dt
     for road in pair:
-        road.y -= 6 * time.dt
+        road.y -= road_step
         if road.y < -15:
             road.y += 30
-    for enemy in enemies:
-        if enemy.x < 0:
-            enemy.y -= 10 * time.dt
-        else:
-            enemy.y -=5 * time.dt
+    left_step = 10 * dt
+    for enemy in enemies_left:
+        enemy.y -= left_step
+    right_step = 5 * dt
+    for enemy in enemies_right:
+        enemy.y -= right_step
 app.run()
 
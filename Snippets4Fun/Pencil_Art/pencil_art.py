@@ -9,16 +9,17 @@ image = cv2.imread("example_image.jpg")  #Insert the name of your own file
 
 # Convert the image to grayscale
 image_gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-image_invert = 255 - image_gray
+image_invert = cv2.bitwise_not(image_gray)
 
-# Apply Gaussian Blur
-blurred = cv2.GaussianBlur(image_invert, (21, 21), 0)
+# Apply Gaussian Blur as two 1D passes (rows, then columns)
+kernel = cv2.getGaussianKernel(21, 0)
+blurred = cv2.sepFilter2D(image_invert, -1, kernel, kernel)
 
-# Invert the blurred image
-inverted_blurred = 255 - blurred
+# Invert the blurred image in place
+cv2.bitwise_not(blurred, dst=blurred)
 
-# Create the pencil sketch
-pencil_sketch = cv2.divide(image_gray, inverted_blurred, scale=256.0)
+# Create the pencil sketch, reusing the inverted image's buffer
+pencil_sketch = cv2.divide(image_gray, blurred, dst=image_invert, scale=256.0)
 
 # Display the original and sketch images
 cv2.imshow("Original", image)